@@ -17,12 +17,19 @@ ENV_PATH = BASE_DIR / "config" / "main.env"
 if not ENV_PATH.exists():
     raise FileNotFoundError(f"❌ 설정 파일을 찾을 수 없습니다: {ENV_PATH}")
 
-load_dotenv(ENV_PATH)
+# 모듈이 다른 경로로 다시 import/reload되어도 main.env는 프로세스당 1회만 파싱
+_ENV_LOADED_FLAG = "_UWB_ENV_LOADED"
+if not os.environ.get(_ENV_LOADED_FLAG):
+    load_dotenv(ENV_PATH)
+    os.environ[_ENV_LOADED_FLAG] = "1"
+
+# main.env 로드 후 환경 변수를 한 번만 스냅샷 (이후 조회는 dict 조회)
+_ENV = dict(os.environ)
 
 
 def _get_required_env(key: str, value_type=str):
     """필수 환경 변수 가져오기 (없으면 에러)"""
-    value = os.getenv(key)
+    value = _ENV.get(key)
     if value is None:
         raise ValueError(f"❌ main.env에 {key} 설정이 필요합니다!")
     
@@ -16,6 +16,7 @@ import struct
 import hashlib
 import time
 import json
+import orjson
 from typing import List, Optional, Dict, Tuple, Set
 from dataclasses import dataclass
 import logging
@@ -49,12 +50,33 @@ DANGER_ZONES = [
 ]
 
 
+# =====================================
+# ==== CRC16 MODBUS 테이블 ====
+# =====================================
+def _build_crc16_modbus_table() -> List[int]:
+    """CRC16 MODBUS 바이트 단위 룩업 테이블 생성 (다항식 0xA001)"""
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            if crc & 0x0001:
+                crc = (crc >> 1) ^ 0xA001
+            else:
+                crc >>= 1
+        table.append(crc)
+    return table
+
+
+# 모듈 로드 시 1회만 계산
+_CRC16_MODBUS_TABLE = _build_crc16_modbus_table()
+
+
 # =====================================
 # ==== 데이터 모델 ====
 # =====================================
-@dataclass
+@dataclass(slots=True)
 class TagLocationInfo:
-    """태그 위치 정보"""
+    """태그 위치 정보 (프레임마다 생성되므로 __slots__ 사용)"""
     tag_id: int
     x_coordinate: float  # m
     y_coordinate: float  # m
@@ -78,12 +100,19 @@ class AppState:
         self.uwb_collector: Optional['UWBCollector'] = None
         self.geofencing: Optional[GeofencingService] = None
         self.api: Optional[LocalSenseAPI] = None
-        self.dashboard_clients: Set[WebSocket] = set()
+        # 대시보드 클라이언트별 전송 대기 큐
+        self.dashboard_clients: Dict[WebSocket, asyncio.Queue] = {}
         self.latest_positions: Dict[int, Tuple[float, float]] = {}
+        # API/대시보드 응답용 위치 캐시 ({tag_id: {"x": ..., "y": ...}}), latest_positions와 함께 갱신
+        # (jsonable_encoder를 거치지 않고 orjson으로 바로 직렬화해야 캐시 효과가 있음 - OrjsonResponse 직접 반환)
+        self.latest_positions_view: Dict[int, Dict[str, float]] = {}
         self.running = False
 
 app_state = AppState()
 
+# 대시보드 클라이언트별 전송 큐 최대 크기 (가득 차면 가장 오래된 메시지부터 버림)
+DASHBOARD_QUEUE_MAXSIZE = 64
+
 
 # =====================================
 # ==== UWB 수집기 ====
@@ -91,6 +120,14 @@ app_state = AppState()
 class UWBCollector:
     """UWB 위치 데이터 수신 (백그라운드)"""
     
+    # 프레임 헤더 4바이트: 헤더(2) 프레임 타입(1) 태그 수(1)
+    _HDR_STRUCT = struct.Struct('>HBB')
+    # 태그 1개당 23바이트: ID(4) X(4) Y(4) Z(2) 맵(1) 배터리(1) 슬립/충전(1) 타임스탬프(4) 층(1) 측위표시(1)
+    _TAG_STRUCT = struct.Struct('>IiihBBBIBB')
+    # 재연결 대기 시간 (초, 실패할 때마다 2배씩 최대값까지 증가)
+    _RECONNECT_DELAY = 1.0
+    _MAX_RECONNECT_DELAY = 30.0
+    
     def __init__(
         self,
         host: str,
@@ -105,33 +142,42 @@ class UWBCollector:
         self.password = password
         self.websocket = None
         self.salt = "abcdefghijklmnopqrstuvwxyz20191107salt"
+        self._salt_bytes = self.salt.encode()
         self.target_tag_id = target_tag_id
         self.running = False
         self.total_received = 0
+        
+        # 인증 정보는 생성 후 바뀌지 않으므로 인증 패킷을 미리 생성
+        self._auth_packet = self._create_auth_packet()
+        
+        # 부저/진동 제어용 WebSocket (알림마다 재연결하지 않고 재사용)
+        self._control_ws = None
+        self._control_lock = asyncio.Lock()
+        self._control_tasks: Set[asyncio.Task] = set()
+        # 제어용 연결의 응답 수신(버림) 작업
+        self._control_reader: Optional[asyncio.Task] = None
+        
+        # 백그라운드로 실행 중인 알림/대시보드 전송 작업
+        self._pending_tasks: Set[asyncio.Task] = set()
     
     def _calculate_crc16_modbus(self, data: bytes) -> int:
-        """CRC16 MODBUS 체크섬 계산"""
+        """CRC16 MODBUS 체크섬 계산 (테이블 기반)"""
         crc = 0xFFFF
         for byte in data:
-            crc ^= byte
-            for _ in range(8):
-                if crc & 0x0001:
-                    crc = (crc >> 1) ^ 0xA001
-                else:
-                    crc >>= 1
+            crc = (crc >> 8) ^ _CRC16_MODBUS_TABLE[(crc ^ byte) & 0xFF]
         return crc
     
     def _create_auth_packet(self) -> bytes:
         """인증 패킷 생성"""
-        pwd_md5 = hashlib.md5(self.password.encode()).hexdigest()
-        salt_pwd = hashlib.md5((pwd_md5 + self.salt).encode()).hexdigest()
+        # 문자열 변환 없이 bytes로만 처리
+        pwd_md5 = hashlib.md5(self.password.encode()).hexdigest().encode()
+        password_bytes = hashlib.md5(pwd_md5 + self._salt_bytes).hexdigest().encode()
         
         frame_header = struct.pack('>H', 0xCC5F)
         frame_type = struct.pack('B', 0x27)
         username_len = struct.pack('>I', len(self.username))
         username_bytes = self.username.encode()
-        password_len = struct.pack('>I', len(salt_pwd))
-        password_bytes = salt_pwd.encode()
+        password_len = struct.pack('>I', len(password_bytes))
         
         crc_data = frame_type + username_len + username_bytes + password_len + password_bytes
         crc = self._calculate_crc16_modbus(crc_data)
@@ -140,14 +186,13 @@ class UWBCollector:
         
         return frame_header + crc_data + crc_bytes + frame_tail
     
-    def _parse_tag_location_data(self, data: bytes) -> List[TagLocationInfo]:
-        """태그 위치 데이터 파싱 (0x81, 0xB4, 0xB5)"""
+    def _parse_tag_location_data(self, data: bytes, target_tag_id: int = 0) -> List[TagLocationInfo]:
+        """태그 위치 데이터 파싱 (0x81, 0xB4, 0xB5), target_tag_id가 0이 아니면 해당 태그만 반환"""
         if len(data) < 5:
             return []
         
         try:
-            header = struct.unpack('>H', data[0:2])[0]
-            frame_type = data[2]
+            header, frame_type, num_tags = self._HDR_STRUCT.unpack_from(data)
             
             if header != 0xCC5F:
                 return []
@@ -162,52 +207,27 @@ class UWBCollector:
             else:
                 return []
             
-            num_tags = data[3]
             if num_tags == 0:
                 return []
             
-            expected_size = 4 + (num_tags * 23) + 4
-            if len(data) < expected_size:
+            # 헤더(4) + 태그 데이터 + CRC/프레임 테일(4)
+            tags_end = self._HDR_STRUCT.size + num_tags * self._TAG_STRUCT.size
+            if len(data) < tags_end + 4:
                 return []
             
             tags = []
-            offset = 4
+            # memoryview 슬라이스로 태그 영역을 복사 없이 참조
+            tags_view = memoryview(data)[self._HDR_STRUCT.size:tags_end]
             
-            for _ in range(num_tags):
-                if offset + 23 > len(data) - 4:
-                    break
-                
-                tag_id = struct.unpack('>I', data[offset:offset+4])[0]
-                offset += 4
-                
-                x_coord = struct.unpack('>i', data[offset:offset+4])[0]
-                offset += 4
-                
-                y_coord = struct.unpack('>i', data[offset:offset+4])[0]
-                offset += 4
-                
-                z_coord = struct.unpack('>h', data[offset:offset+2])[0]
-                offset += 2
-                
-                map_id = data[offset]
-                offset += 1
-                
-                battery = data[offset]
-                offset += 1
+            for (tag_id, x_coord, y_coord, z_coord, map_id, battery,
+                 sleep_charge_flag, timestamp, floor_number,
+                 positioning_indication) in self._TAG_STRUCT.iter_unpack(tags_view):
+                # 타겟 태그가 아니면 변환/객체 생성 생략
+                if target_tag_id and tag_id != target_tag_id:
+                    continue
                 
-                sleep_charge_flag = data[offset]
-                sleep_flag = bool((sleep_charge_flag >> 4) & 0x0F)
+                sleep_flag = bool(sleep_charge_flag & 0xF0)
                 charging_flag = bool(sleep_charge_flag & 0x0F)
-                offset += 1
-                
-                timestamp = struct.unpack('>I', data[offset:offset+4])[0]
-                offset += 4
-                
-                floor_number = data[offset]
-                offset += 1
-                
-                positioning_indication = data[offset]
-                offset += 1
                 
                 # 좌표 변환
                 if frame_type == 0xB4:
@@ -220,7 +240,7 @@ class UWBCollector:
                     y_coord = y_coord / 100.0
                     z_coord = z_coord / 100.0
                 
-                tag_info = TagLocationInfo(
+                tags.append(TagLocationInfo(
                     tag_id=tag_id,
                     x_coordinate=x_coord,
                     y_coordinate=y_coord,
@@ -233,9 +253,7 @@ class UWBCollector:
                     floor_number=floor_number,
                     positioning_indication=positioning_indication,
                     coordinate_type=coordinate_type
-                )
-                
-                tags.append(tag_info)
+                ))
             
             return tags
             
@@ -244,77 +262,101 @@ class UWBCollector:
             return []
     
     async def _process_location_update(self, tags: List[TagLocationInfo]):
-        """위치 업데이트 처리 (지오펜싱 + 대시보드 전송)"""
-        # 타겟 태그만 필터링 (0이면 모든 태그)
-        if self.target_tag_id == 0:
-            target_tags = tags  # 모든 태그 허용
-        else:
-            target_tags = [t for t in tags if t.tag_id == self.target_tag_id]
+        """위치 업데이트 처리 (지오펜싱 + 대시보드 전송, 타겟 태그는 파싱 단계에서 필터링됨)"""
+        # 프레임 단위로 위치를 모아 지오펜싱을 한 번에 처리
+        positions = {tag.tag_id: (tag.x_coordinate, tag.y_coordinate) for tag in tags}
         
-        if not target_tags:
-            return
+        # 최신 위치 저장
+        app_state.latest_positions.update(positions)
+        app_state.latest_positions_view.update(
+            (tag_id, {"x": x, "y": y}) for tag_id, (x, y) in positions.items()
+        )
         
-        for tag in target_tags:
-            # 최신 위치 저장
-            app_state.latest_positions[tag.tag_id] = (tag.x_coordinate, tag.y_coordinate)
-            
-            # 지오펜싱 처리
-            positions = {tag.tag_id: (tag.x_coordinate, tag.y_coordinate)}
-            alerts = app_state.geofencing.process_positions(positions)
-            
-            # 알림 전송
-            for alert_info in alerts:
-                await self._send_alert(alert_info)
-            
+        # 지오펜싱 처리
+        alerts = app_state.geofencing.process_positions(positions)
+        alerted_tag_ids = {alert_info["tag_id"] for alert_info in alerts}
+        
+        # 알림 전송 (수신 루프를 막지 않도록 백그라운드 실행)
+        for alert_info in alerts:
+            self._run_in_background(self._send_alert(alert_info))
+        
+        for tag in tags:
             # 대시보드에 실시간 전송
-            await self._broadcast_to_dashboard({
+            self._broadcast_to_dashboard({
                 "type": "position_update",
                 "tag_id": tag.tag_id,
                 "x": tag.x_coordinate,
                 "y": tag.y_coordinate,
                 "battery": tag.battery,
                 "timestamp": tag.timestamp,
-                "in_danger_zone": len(alerts) > 0
+                "in_danger_zone": tag.tag_id in alerted_tag_ids
             })
     
-    async def _send_buzzer_vibration(self, tag_id: int):
-        """별도 WebSocket으로 부저/진동 제어"""
-        try:
+    def _run_in_background(self, coro):
+        """수신 루프와 분리하여 코루틴 실행 (종료 시 취소할 수 있도록 추적)"""
+        task = asyncio.create_task(coro)
+        self._pending_tasks.add(task)
+        task.add_done_callback(self._pending_tasks.discard)
+        return task
+    
+    async def _get_control_ws(self):
+        """제어용 WebSocket 반환 (연결이 없거나 끊겼으면 재연결)"""
+        if self._control_ws is None or self._control_ws.close_code is not None:
             logger.info(f"📡 부저/진동 WebSocket 연결 시작...")
-            
             # 제어용 WebSocket 연결 (인증 없음)
-            control_ws = await websockets.connect(
+            self._control_ws = await websockets.connect(
                 f"ws://{self.host}:{self.port}/",
                 subprotocols=["localSense-Json"]
             )
-            
-            # 진동/부저 시작 (enable)
-            request_enable = {
-                "localsense_conf_request": {
-                    "conf_type": "tagvibrateandshake",
-                    "conf_value": "enable",
-                    "tagid": str(tag_id)
-                }
-            }
-            await control_ws.send(json.dumps(request_enable))
-            logger.info(f"✅ 태그 {tag_id} 진동/부저 시작")
-            
-            # 1초 대기
-            await asyncio.sleep(1)
-            
-            # 진동/부저 중지 (disable)
-            request_disable = {
-                "localsense_conf_request": {
-                    "conf_type": "tagvibrateandshake",
-                    "conf_value": "disable",
-                    "tagid": str(tag_id)
-                }
+            # 응답을 읽지 않으면 수신 버퍼가 차서 ping/close 처리까지 막히므로 계속 읽어서 버림
+            if self._control_reader is not None:
+                self._control_reader.cancel()
+            self._control_reader = asyncio.create_task(self._drain_control_ws(self._control_ws))
+        return self._control_ws
+    
+    @staticmethod
+    async def _drain_control_ws(control_ws):
+        """제어용 WebSocket 응답 수신 (응답 내용은 사용하지 않음)"""
+        try:
+            async for _ in control_ws:
+                pass
+        except websockets.ConnectionClosed:
+            pass
+    
+    async def _send_control_request(self, tag_id: int, conf_value: str):
+        """제어용 WebSocket으로 진동/부저 설정 전송 (enable/disable)"""
+        request = {
+            "localsense_conf_request": {
+                "conf_type": "tagvibrateandshake",
+                "conf_value": conf_value,
+                "tagid": str(tag_id)
             }
-            await control_ws.send(json.dumps(request_disable))
+        }
+        # 공유 연결이므로 전송을 직렬화
+        async with self._control_lock:
+            control_ws = await self._get_control_ws()
+            await control_ws.send(json.dumps(request))
+    
+    async def _disable_buzzer_vibration_later(self, tag_id: int, delay: float):
+        """delay초 후 진동/부저 중지"""
+        await asyncio.sleep(delay)
+        try:
+            await self._send_control_request(tag_id, "disable")
             logger.info(f"⏹ 태그 {tag_id} 진동/부저 중지")
+        except Exception as e:
+            logger.error(f"❌ 알람 중지 오류: {e}")
+    
+    async def _send_buzzer_vibration(self, tag_id: int):
+        """별도 WebSocket으로 부저/진동 제어 (연결 재사용)"""
+        try:
+            # 진동/부저 시작 (enable)
+            await self._send_control_request(tag_id, "enable")
+            logger.info(f"✅ 태그 {tag_id} 진동/부저 시작")
             
-            # 연결 종료
-            await control_ws.close()
+            # 1초 후 중지 (disable)는 백그라운드에서 처리
+            task = asyncio.create_task(self._disable_buzzer_vibration_later(tag_id, 1.0))
+            self._control_tasks.add(task)
+            task.add_done_callback(self._control_tasks.discard)
             
         except Exception as e:
             logger.error(f"❌ 알람 전송 오류: {e}")
@@ -333,7 +375,7 @@ class UWBCollector:
         await self._send_buzzer_vibration(tag_id)
         
         # 대시보드에 알림 전송
-        await self._broadcast_to_dashboard({
+        self._broadcast_to_dashboard({
             "type": "alert",
             "tag_id": tag_id,
             "zone_name": zone.name,
@@ -341,17 +383,18 @@ class UWBCollector:
             "timestamp": int(time.time() * 1000)
         })
     
-    async def _broadcast_to_dashboard(self, message: dict):
-        """대시보드 클라이언트에게 메시지 브로드캐스트"""
-        disconnected = set()
-        for client in app_state.dashboard_clients:
-            try:
-                await client.send_json(message)
-            except:
-                disconnected.add(client)
+    def _broadcast_to_dashboard(self, message: dict):
+        """대시보드 클라이언트 큐에 메시지 추가 (실제 전송은 클라이언트별 writer 태스크가 처리)"""
+        if not app_state.dashboard_clients:
+            return
         
-        # 연결 끊긴 클라이언트 제거
-        app_state.dashboard_clients -= disconnected
+        # 1회만 직렬화 후 모든 클라이언트 큐에 추가 (수신 루프는 전송을 기다리지 않음)
+        payload = orjson.dumps(message).decode()
+        for queue in app_state.dashboard_clients.values():
+            if queue.full():
+                # 느린 클라이언트는 가장 오래된 메시지를 버림
+                queue.get_nowait()
+            queue.put_nowait(payload)
     
     async def connect(self):
         """WebSocket 연결"""
@@ -375,8 +418,7 @@ class UWBCollector:
             return False
         
         try:
-            auth_packet = self._create_auth_packet()
-            await self.websocket.send(auth_packet)
+            await self.websocket.send(self._auth_packet)
             await asyncio.wait_for(self.websocket.recv(), timeout=5.0)
             logger.info("🔐 Authentication successful")
             return True
@@ -393,23 +435,41 @@ class UWBCollector:
         logger.info(f"👀 실시간 위치 수신 시작 (타겟 태그: {tag_info})...")
         
         self.running = True
+        reconnect_delay = self._RECONNECT_DELAY
         
         try:
             while self.running:
                 try:
-                    # WebSocket에서 데이터 수신
-                    data = await asyncio.wait_for(self.websocket.recv(), timeout=1.0)
+                    # WebSocket에서 데이터 수신 (연결 유지 확인은 ping_interval/ping_timeout에 맡김)
+                    data = await self.websocket.recv()
+                    reconnect_delay = self._RECONNECT_DELAY
                     
-                    # 태그 위치 파싱
-                    tags = self._parse_tag_location_data(data)
+                    # 태그 위치 파싱 (순수 파이썬 파싱은 GIL을 잡고 있으므로 스레드로 넘기지 않고 바로 처리)
+                    tags = self._parse_tag_location_data(data, self.target_tag_id)
                     
                     if tags:
                         self.total_received += len(tags)
                         # 지오펜싱 처리
                         await self._process_location_update(tags)
                     
-                except asyncio.TimeoutError:
-                    continue
+                except websockets.ConnectionClosed:
+                    # disconnect()로 종료된 경우
+                    if not self.running:
+                        break
+                    
+                    # 장비가 연결 직후 끊는 경우에도 재연결이 폭주하지 않도록 매번 대기
+                    logger.warning(f"🔌 WebSocket 연결 끊김 - {reconnect_delay:.0f}초 후 재연결 시도...")
+                    await asyncio.sleep(reconnect_delay)
+                    reconnect_delay = min(reconnect_delay * 2, self._MAX_RECONNECT_DELAY)
+                    if not self.running:
+                        break
+                    
+                    if await self.connect():
+                        # 연결 중에 disconnect()가 호출되었으면 새 연결을 닫고 종료
+                        if not self.running:
+                            await self.websocket.close()
+                            break
+                        await self.authenticate()
                 except Exception as e:
                     logger.error(f"⚠️ 수신 오류: {e}")
                     continue
@@ -423,6 +483,22 @@ class UWBCollector:
         if self.websocket:
             await self.websocket.close()
             logger.info("🔌 WebSocket disconnected")
+        
+        # 진행 중인 알림/대시보드 전송 작업 취소
+        for task in list(self._pending_tasks):
+            task.cancel()
+        if self._pending_tasks:
+            await asyncio.gather(*self._pending_tasks, return_exceptions=True)
+        
+        # 대기 중인 진동/부저 중지 요청을 마친 뒤 제어용 연결 종료
+        if self._control_tasks:
+            await asyncio.gather(*self._control_tasks, return_exceptions=True)
+        if self._control_ws is not None:
+            await self._control_ws.close()
+            self._control_ws = None
+        if self._control_reader is not None:
+            await asyncio.gather(self._control_reader, return_exceptions=True)
+            self._control_reader = None
         logger.info(f"📊 총 수신: {self.total_received}개")
 
 
@@ -489,13 +565,27 @@ async def lifespan(app: FastAPI):
     logger.info("🛑 시스템 종료 중...")
     if app_state.uwb_collector:
         await app_state.uwb_collector.disconnect()
+    if app_state.api:
+        app_state.api.close()
+
+
+class OrjsonResponse(JSONResponse):
+    """
+    orjson 기반 JSON 응답 (정수 태그 ID 키 허용)
+    
+    default_response_class로 지정해도 dict를 반환하는 엔드포인트는 FastAPI가
+    jsonable_encoder로 먼저 변환하므로, 응답이 큰 엔드포인트는 이 클래스를 직접 반환
+    """
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
 
 
 app = FastAPI(
     title="UWB 지오펜싱 알림 시스템",
     description="실시간 UWB 위치 데이터 수신 및 지오펜싱 처리",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=OrjsonResponse
 )
 
 # CORS 설정 (대시보드 연동용)
@@ -524,17 +614,15 @@ async def root():
 @app.get("/api/status")
 async def get_status():
     """시스템 상태 조회"""
-    return {
+    # 위치 목록이 커질 수 있으므로 Response를 직접 반환해 jsonable_encoder 변환을 건너뜀
+    return OrjsonResponse(content={
         "uwb_connected": app_state.uwb_collector.running if app_state.uwb_collector else False,
         "total_received": app_state.uwb_collector.total_received if app_state.uwb_collector else 0,
         "dashboard_clients": len(app_state.dashboard_clients),
         "target_tag_id": settings.TARGET_TAG_ID,
-        "zones": app_state.geofencing.get_status()["zones"] if app_state.geofencing else [],
-        "latest_positions": {
-            tag_id: {"x": pos[0], "y": pos[1]}
-            for tag_id, pos in app_state.latest_positions.items()
-        }
-    }
+        "zones": app_state.geofencing.get_zones() if app_state.geofencing else [],
+        "latest_positions": app_state.latest_positions_view
+    })
 
 
 @app.get("/api/zones")
@@ -542,18 +630,14 @@ async def get_zones():
     """위험 구역 목록 조회"""
     if not app_state.geofencing:
         return {"zones": []}
-    return {"zones": app_state.geofencing.get_status()["zones"]}
+    return {"zones": app_state.geofencing.get_zones()}
 
 
 @app.get("/api/positions")
 async def get_positions():
     """모든 태그의 최신 위치 조회"""
-    return {
-        "positions": {
-            tag_id: {"x": pos[0], "y": pos[1]}
-            for tag_id, pos in app_state.latest_positions.items()
-        }
-    }
+    # Response를 직접 반환해 jsonable_encoder 변환을 건너뜀
+    return OrjsonResponse(content={"positions": app_state.latest_positions_view})
 
 
 @app.get("/api/tags/{tag_id}/position")
@@ -562,7 +646,7 @@ async def get_tag_position(tag_id: int):
     pos = app_state.latest_positions.get(tag_id)
     if pos:
         return {"tag_id": tag_id, "x": pos[0], "y": pos[1]}
-    return JSONResponse(
+    return OrjsonResponse(
         status_code=404,
         content={"error": f"Tag {tag_id} not found"}
     )
@@ -571,31 +655,46 @@ async def get_tag_position(tag_id: int):
 # =====================================
 # ==== WebSocket 엔드포인트 (대시보드용) ====
 # =====================================
+async def _dashboard_writer(websocket: WebSocket, queue: asyncio.Queue):
+    """클라이언트별 전송 태스크 (큐에 쌓인 메시지를 순서대로 전송)"""
+    try:
+        while True:
+            payload = await queue.get()
+            await websocket.send_text(payload)
+    except Exception:
+        # 전송 실패 시 더 이상 브로드캐스트 대상이 되지 않도록 제거
+        app_state.dashboard_clients.pop(websocket, None)
+
+
 @app.websocket("/ws/dashboard")
 async def websocket_dashboard(websocket: WebSocket):
     """대시보드 실시간 연결"""
     await websocket.accept()
-    app_state.dashboard_clients.add(websocket)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=DASHBOARD_QUEUE_MAXSIZE)
+    
+    # 초기 상태를 먼저 큐에 넣어 이후 업데이트보다 앞서 전송
+    queue.put_nowait(orjson.dumps({
+        "type": "initial_state",
+        "zones": app_state.geofencing.get_zones() if app_state.geofencing else [],
+        "positions": app_state.latest_positions_view
+    }, option=orjson.OPT_NON_STR_KEYS).decode())
+    
+    writer = asyncio.create_task(_dashboard_writer(websocket, queue))
+    app_state.dashboard_clients[websocket] = queue
     logger.info(f"📱 대시보드 클라이언트 연결 (총 {len(app_state.dashboard_clients)}개)")
     
     try:
-        # 초기 상태 전송
-        await websocket.send_json({
-            "type": "initial_state",
-            "zones": app_state.geofencing.get_status()["zones"] if app_state.geofencing else [],
-            "positions": {
-                tag_id: {"x": pos[0], "y": pos[1]}
-                for tag_id, pos in app_state.latest_positions.items()
-            }
-        })
-        
         # 연결 유지 (메시지 수신 대기)
         while True:
             data = await websocket.receive_text()
             # 클라이언트에서 메시지 보내면 처리 (필요 시)
     
     except WebSocketDisconnect:
-        app_state.dashboard_clients.discard(websocket)
+        pass
+    
+    finally:
+        app_state.dashboard_clients.pop(websocket, None)
+        writer.cancel()
         logger.info(f"📱 대시보드 클라이언트 연결 해제 (남은 {len(app_state.dashboard_clients)}개)")
 
 
@@ -604,6 +703,7 @@ async def websocket_dashboard(websocket: WebSocket):
 # =====================================
 if __name__ == "__main__":
     import uvicorn
+    # loop/http는 기본값(auto): uvicorn[standard]로 설치된 uvloop/httptools가 있으면 자동 사용
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
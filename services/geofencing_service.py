@@ -1,18 +1,18 @@
 """
-지오펜싱 서비스 모듈 (Shapely 기반)
-위험 구역 정의 및 진입 감지 로직 - 산업 표준 Shapely 라이브러리 사용
+지오펜싱 서비스 모듈
+위험 구역 정의 및 진입 감지 로직 - 축 정렬 직사각형(AABB) 비교 사용
 """
+import math
 import time
 from dataclasses import dataclass
 from typing import Dict, Tuple, List, Optional, Callable
-from shapely.geometry import Point, Polygon
 from config.settings import settings
 
 
 @dataclass
 class Zone:
     """
-    직사각형 위험 구역 정의 (Shapely 기반)
+    직사각형 위험 구역 정의 (축 정렬)
     4개의 모서리 좌표로 직사각형 영역을 정의합니다.
     """
     min_x: float  # 좌하단 x 좌표
@@ -22,28 +22,18 @@ class Zone:
     name: str = "danger_zone"
     
     def __post_init__(self):
-        """좌표 유효성 검증 및 Shapely Polygon 생성"""
+        """좌표 유효성 검증"""
         if self.min_x >= self.max_x:
             raise ValueError(f"min_x({self.min_x})는 max_x({self.max_x})보다 작아야 합니다")
         if self.min_y >= self.max_y:
             raise ValueError(f"min_y({self.min_y})는 max_y({self.max_y})보다 작아야 합니다")
-        
-        # Shapely Polygon 생성 (시계 반대방향)
-        object.__setattr__(self, '_polygon', Polygon([
-            (self.min_x, self.min_y),  # 좌하단
-            (self.max_x, self.min_y),  # 우하단
-            (self.max_x, self.max_y),  # 우상단
-            (self.min_x, self.max_y),  # 좌상단
-            (self.min_x, self.min_y),  # 좌하단 (닫기)
-        ]))
     
     def contains_point(self, x: float, y: float) -> bool:
         """
-        Shapely를 사용한 점-다각형 포함 관계 체크
-        산업 표준 알고리즘으로 매우 정확함
+        점-직사각형 포함 관계 체크 (경계 포함)
+        축 정렬 직사각형이므로 4번의 비교로 충분함
         """
-        point = Point(x, y)
-        return self._polygon.contains(point) or self._polygon.touches(point)
+        return self.min_x <= x <= self.max_x and self.min_y <= y <= self.max_y
     
     def get_center(self) -> Tuple[float, float]:
         """직사각형 중심 좌표 반환"""
@@ -61,13 +51,14 @@ class Zone:
         ]
     
     def distance_to_point(self, x: float, y: float) -> float:
-        """점까지의 최단 거리 계산 (Shapely 기능)"""
-        point = Point(x, y)
-        return self._polygon.distance(point)
+        """점까지의 최단 거리 계산 (내부이면 0)"""
+        dx = max(self.min_x - x, 0.0, x - self.max_x)
+        dy = max(self.min_y - y, 0.0, y - self.max_y)
+        return math.hypot(dx, dy)
 
 
 class GeofencingService:
-    """지오펜싱 AI - Shapely 기반 위험 구역 진입 감지"""
+    """지오펜싱 AI - 직사각형 위험 구역 진입 감지"""
     
     def __init__(
         self,
@@ -90,18 +81,35 @@ class GeofencingService:
         self.retrigger_after_sec = retrigger_after_sec if retrigger_after_sec is not None else settings.RETRIGGER_AFTER_SEC
         self.target_tag_ids = target_tag_ids
         
-        # (tag_id, zone_name) -> last_fired_timestamp
+        # (tag_id, zone_name) -> last_fired_timestamp (time.monotonic 기준)
         self._fired: Dict[Tuple[int, str], float] = {}
         
         # 최신 위치 정보 저장
         self.latest_positions: Dict[int, Tuple[float, float]] = {}
         
-        print(f"✅ GeofencingService 초기화 완료 (Shapely 기반)")
+        # 구역 정보는 실행 중 바뀌지 않으므로 API 응답용 데이터를 미리 생성
+        self._zones_snapshot: List[Dict] = [
+            {
+                "name": z.name,
+                "min_x": z.min_x,
+                "min_y": z.min_y,
+                "max_x": z.max_x,
+                "max_y": z.max_y,
+                "center": {"x": z.get_center()[0], "y": z.get_center()[1]},
+                "corners": [
+                    {"x": corner[0], "y": corner[1]}
+                    for corner in z.get_corners()
+                ],
+            }
+            for z in self.zones
+        ]
+        
+        print(f"✅ GeofencingService 초기화 완료")
         print(f"   - 위험구역 수: {len(self.zones)}")
         for zone in self.zones:
             print(f"   - {zone.name}: ({zone.min_x:.3f}, {zone.min_y:.3f}) ~ ({zone.max_x:.3f}, {zone.max_y:.3f})")
     
-    def _can_fire(self, key: Tuple[int, str]) -> bool:
+    def _can_fire(self, key: Tuple[int, str], now: float) -> bool:
         """재트리거 가능 여부 확인"""
         if self.retrigger_after_sec is None:
             return key not in self._fired
@@ -110,22 +118,15 @@ class GeofencingService:
         if last_time is None:
             return True
         
-        return (time.time() - last_time) >= self.retrigger_after_sec
+        return (now - last_time) >= self.retrigger_after_sec
     
-    def _mark_fired(self, key: Tuple[int, str]):
+    def _mark_fired(self, key: Tuple[int, str], now: float):
         """트리거 시간 기록"""
-        self._fired[key] = time.time()
-    
-    def _clear_if_outside(self, tag_id: int, zone: Zone, pos: Tuple[float, float]):
-        """구역을 벗어나면 트리거 상태 해제"""
-        x, y = pos
-        if not zone.contains_point(x, y):
-            key = (tag_id, zone.name)
-            self._fired.pop(key, None)
+        self._fired[key] = now
     
     def process_positions(self, positions: Dict[int, Tuple[float, float]]) -> List[Dict]:
         """
-        태그 최신 좌표를 받아 위험 구역 진입 여부 평가 (Shapely 기반)
+        태그 최신 좌표를 받아 위험 구역 진입 여부 평가
         
         Args:
             positions: {tag_id: (x, y)} 형태의 태그 위치 딕셔너리
@@ -137,6 +138,8 @@ class GeofencingService:
         self.latest_positions.update(positions)
         
         alerts = []
+        # 프레임당 1회만 시간 측정 (시스템 시계 변경에 영향받지 않는 monotonic 사용)
+        now = time.monotonic()
         
         for tag_id, (x, y) in positions.items():
             # 타겟 태그 필터링
@@ -144,52 +147,44 @@ class GeofencingService:
                 continue
             
             for zone in self.zones:
-                # 구역 밖으로 나갔다면 상태 초기화
-                self._clear_if_outside(tag_id, zone, (x, y))
+                key = (tag_id, zone.name)
                 
-                # Shapely 기반 구역 진입 감지 (매우 정확!)
-                if zone.contains_point(x, y):
-                    key = (tag_id, zone.name)
-                    if self._can_fire(key):
-                        self._mark_fired(key)
-                        
-                        # 위험구역 진입 감지
-                        # distance = zone.distance_to_point(x, y)
-                        # print(f"🎯 [Shapely] 태그 {tag_id} 구역 '{zone.name}' 진입 확인!")
-                        # print(f"   - 좌표: ({x:.3f}, {y:.3f})")
-                        # print(f"   - 경계까지 거리: {distance:.3f}m (0이면 내부)")
-                        
-                        # 알림 목록에 추가
-                        alerts.append({
-                            "tag_id": tag_id,
-                            "zone": zone,
-                            "position": (x, y)
-                        })
-                        
-                        # 경고 콜백 실행 (위치 정보 전달)
-                        if self.on_danger:
-                            self.on_danger(tag_id, zone, (x, y))
+                # 구역 밖으로 나갔다면 상태 초기화 (포함 여부는 1회만 계산)
+                if not zone.contains_point(x, y):
+                    self._fired.pop(key, None)
+                    continue
+                
+                # 구역 진입 감지 (경계 포함)
+                if self._can_fire(key, now):
+                    self._mark_fired(key, now)
+                    
+                    # 위험구역 진입 감지
+                    # distance = zone.distance_to_point(x, y)
+                    # print(f"🎯 태그 {tag_id} 구역 '{zone.name}' 진입 확인!")
+                    # print(f"   - 좌표: ({x:.3f}, {y:.3f})")
+                    # print(f"   - 경계까지 거리: {distance:.3f}m (0이면 내부)")
+                    
+                    # 알림 목록에 추가
+                    alerts.append({
+                        "tag_id": tag_id,
+                        "zone": zone,
+                        "position": (x, y)
+                    })
+                    
+                    # 경고 콜백 실행 (위치 정보 전달)
+                    if self.on_danger:
+                        self.on_danger(tag_id, zone, (x, y))
         
         return alerts
     
+    def get_zones(self) -> List[Dict]:
+        """위험 구역 목록 조회 (API용, 미리 생성된 데이터)"""
+        return self._zones_snapshot
+    
     def get_status(self) -> Dict:
         """현재 상태 조회 (API용)"""
         return {
-            "zones": [
-                {
-                    "name": z.name,
-                    "min_x": z.min_x,
-                    "min_y": z.min_y,
-                    "max_x": z.max_x,
-                    "max_y": z.max_y,
-                    "center": {"x": z.get_center()[0], "y": z.get_center()[1]},
-                    "corners": [
-                        {"x": corner[0], "y": corner[1]}
-                        for corner in z.get_corners()
-                    ],
-                }
-                for z in self.zones
-            ],
+            "zones": self._zones_snapshot,
             "tracked_tags": list(self.latest_positions.keys()),
             "latest_positions": {
                 tag_id: {"x": pos[0], "y": pos[1]}
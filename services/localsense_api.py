@@ -2,49 +2,227 @@
 LocalSense API 클래스
 부저, 진동, 디스플레이 메시지 전송
 """
-import json
-import hmac
+import asyncio
 import hashlib
-from typing import List, Dict, Any, Optional
+import hmac
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 
+import httpx
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+
 
 
 
+class _LocalSenseBase:
+    """동기/비동기 LocalSense API 공통 처리 (서명, 페이로드 생성, 응답 해석)"""
 
-class LocalSenseAPI:
-    def __init__(self, base_url: str, secret_key: str):
+    _BASE_HEADERS = {"Content-Type": "application/json"}
+    # 이보다 큰 응답은 JSON으로 해석하지 않음 (잘못된 포트의 HTML 오류 페이지 등)
+    _MAX_JSON_RESPONSE_BYTES = 65536
+    # 오류 메시지에 포함할 응답 본문 최대 길이 (bytes)
+    _MAX_ERROR_BODY_BYTES = 512
+    # /andon/show 페이로드 템플릿 (고정 필드 포함, 키 순서 유지)
+    _DISPLAY_TEMPLATE: Dict[str, Any] = {
+        "iwatchid": None,
+        "msgid": "10",
+        "msgtitle": None,
+        "msgdesc": None,
+        "msgtime": "123",
+        "msgtype": None,
+        "vibrateoff": None,
+    }
+    # send_alarm_batch 알람 파라미터 기본값 (send_vibration_and_buzzer와 동일, _alarm_payload 인자 순서)
+    _ALARM_DEFAULTS: Dict[str, int] = {
+        "shake_sdur": 5,
+        "shake_edur": 15,
+        "vibrate_times": 1,
+        "vibrate_dur": 6,
+        "send_counts": 1,
+        "send_interval": 1,
+    }
+    # 지원 서명 알고리즘 (md5: 기존 프로토콜, blake2b/sha256: 서버 펌웨어가 지원할 때만 사용)
+    _SIGN_ALGOS = ("md5", "blake2b", "sha256")
+
+    def __init__(self, base_url: str, secret_key: str, algo: str = "md5"):
+        if algo not in self._SIGN_ALGOS:
+            raise ValueError(f"지원하지 않는 서명 알고리즘입니다: {algo} (지원: {', '.join(self._SIGN_ALGOS)})")
         if base_url.endswith("/"):
             base_url = base_url[:-1]
         self.base_url = base_url
         self.secret_key = secret_key
+        self.algo = algo
+        self._key_bytes = secret_key.encode("utf-8")
+        if algo == "blake2b" and len(self._key_bytes) > hashlib.blake2b.MAX_KEY_SIZE:
+            raise ValueError(f"blake2b 서명 키는 {hashlib.blake2b.MAX_KEY_SIZE}바이트 이하여야 합니다")
 
-    @classmethod  
-    def from_host(cls, ip: str, port: int = 8888, secret_key: str = "") -> "LocalSenseAPI":
-        return cls(base_url=f"http://{ip}:{port}", secret_key=secret_key)
+        # 키가 적용된 MAC 상태를 미리 만들어 두고 요청마다 copy()해서 사용 (키 패딩/초기화 생략)
+        if algo == "blake2b":
+            # 키 모드 BLAKE2b는 HMAC 구조 없이 1회 해시로 MAC 생성
+            self._mac_template = hashlib.blake2b(key=self._key_bytes, digest_size=16)
+        else:
+            self._mac_template = hmac.new(self._key_bytes, digestmod=algo)
 
-    def _sign(self, path: str, body: str) -> str:
-        """HMAC-MD5 서명 생성"""
-        msg = (path + body).encode("utf-8")
-        key = self.secret_key.encode("utf-8")
-        return hmac.new(key, msg, hashlib.md5).hexdigest()
+        # 경로별 전체 URL / 서명용 bytes 캐시
+        self._urls: Dict[str, str] = {}
+        self._path_bytes: Dict[str, bytes] = {
+            "/andon/alarm": b"/andon/alarm",
+            "/andon/show": b"/andon/show",
+        }
 
-    def _post(self, path: str, payload: Dict[str, Any], timeout: float = 10.0) -> Dict[str, Any]:
-        """공통 POST 처리"""
-        url = self.base_url + path
-        body = json.dumps(payload, separators=(",", ":"))
-        headers = {"Content-Type": "application/json", "sign": self._sign(path, body)}
+        # 같은 (path, body)의 서명은 항상 같으므로 최근 서명을 캐시 (스레드 안전)
+        self._sign_cached = lru_cache(maxsize=256)(self._sign)
+        # 같은 디스플레이 메시지를 반복 전송하는 경우가 많으므로 직렬화된 body를 캐시
+        self._display_body_cached = lru_cache(maxsize=64)(self._display_body)
+
+    @classmethod
+    def from_host(cls, ip: str, port: int = 8888, secret_key: str = "", algo: str = "md5"):
+        return cls(base_url=f"http://{ip}:{port}", secret_key=secret_key, algo=algo)
+
+    def _sign(self, path: str, body: bytes) -> str:
+        """서명 생성 (기본 HMAC-MD5)"""
+        path_bytes = self._path_bytes.get(path)
+        if path_bytes is None:
+            path_bytes = self._path_bytes.setdefault(path, path.encode("utf-8"))
+        mac = self._mac_template.copy()
+        mac.update(path_bytes)
+        mac.update(body)
+        return mac.hexdigest()
 
+    def _headers(self, path: str, body: bytes) -> Dict[str, str]:
+        """요청 헤더 생성"""
+        return {**self._BASE_HEADERS, "sign": self._sign_cached(path, body)}
+
+    @classmethod
+    def _parse_response(cls, status_code: int, headers, content: bytes) -> Dict[str, Any]:
+        """응답 해석 (성공 시 응답 JSON, 실패 시 오류 딕셔너리)"""
+        data: Optional[Dict[str, Any]] = None
+
+        # 200이 아니거나 너무 큰 응답은 파싱하지 않음
+        # (서버가 JSON을 text/html 등으로 보내는 경우가 있어 Content-Type은 보지 않음)
         try:
-            resp = requests.post(url, data=body, headers=headers, timeout=timeout)
+            content_length = int(headers.get("Content-Length") or len(content))
+        except ValueError:
+            # 잘못된 Content-Length 헤더는 무시하고 실제 본문 길이 사용
+            content_length = len(content)
+        if status_code == 200 and content_length < cls._MAX_JSON_RESPONSE_BYTES:
             try:
-                data: Optional[Dict[str, Any]] = resp.json()
-            except ValueError:
+                data = orjson.loads(content)
+            except orjson.JSONDecodeError:
                 data = None
 
-            if resp.status_code == 200 and isinstance(data, dict):
-                return data
-            return {"issuccess": "false", "message": f"HTTP {resp.status_code}: {resp.text}"}
+        if isinstance(data, dict):
+            return data
+        # 오류 본문은 앞부분만 디코딩 (큰 HTML 오류 페이지 전체를 문자열로 만들지 않음)
+        text = content[:cls._MAX_ERROR_BODY_BYTES].decode("utf-8", errors="replace")
+        return {"issuccess": "false", "message": f"HTTP {status_code}: {text}"}
+
+    @staticmethod
+    def _alarm_payload(
+        tag_ids: List[int],
+        shake_sdur: int,
+        shake_edur: int,
+        vibrate_times: int,
+        vibrate_dur: int,
+        send_counts: int,
+        send_interval: int,
+    ) -> Dict[str, Any]:
+        """/andon/alarm 페이로드 생성"""
+        return {
+            "tag_ids": tag_ids,
+            "shake_sdur": shake_sdur,
+            "shake_edur": shake_edur,
+            "vibrate_times": vibrate_times,
+            "vibrate_dur": vibrate_dur,
+            "send_counts": send_counts,
+            "send_interval": send_interval,
+        }
+
+    @classmethod
+    def _display_payload(cls, tag_id: int, title: str, message: str, msg_type: str, vibrate_off: bool) -> Dict[str, Any]:
+        """/andon/show 페이로드 생성 (템플릿 복사 후 가변 필드만 설정)"""
+        payload = cls._DISPLAY_TEMPLATE.copy()
+        payload["iwatchid"] = str(tag_id)
+        payload["msgtitle"] = title
+        payload["msgdesc"] = message
+        payload["msgtype"] = msg_type
+        payload["vibrateoff"] = "1" if vibrate_off else "0"
+        return payload
+
+    def _display_body(self, tag_id: int, title: str, message: str, msg_type: str, vibrate_off: bool) -> bytes:
+        """/andon/show 요청 body 생성 (UTF-8 JSON bytes)"""
+        return orjson.dumps(self._display_payload(tag_id, title, message, msg_type, vibrate_off))
+
+    @classmethod
+    def _alarm_batch_payloads(cls, groups: List[Tuple[List[int], Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """같은 알람 파라미터를 가진 그룹의 태그를 합쳐 파라미터 조합당 1개의 페이로드 생성"""
+        # 기본값을 채운 파라미터 값 튜플 -> 태그 ID (dict로 순서 유지 + 중복 제거)
+        merged: Dict[Tuple[Any, ...], Dict[int, None]] = {}
+        for tag_ids, params in groups:
+            unknown = set(params) - cls._ALARM_DEFAULTS.keys()
+            if unknown:
+                raise ValueError(f"알 수 없는 알람 파라미터입니다: {', '.join(sorted(unknown))}")
+
+            normalized = {**cls._ALARM_DEFAULTS, **params}
+            key = tuple(normalized[name] for name in cls._ALARM_DEFAULTS)
+            try:
+                merged_tag_ids = merged.setdefault(key, {})
+            except TypeError:
+                raise ValueError(f"알람 파라미터 값은 hashable이어야 합니다: {params}") from None
+            merged_tag_ids.update(dict.fromkeys(tag_ids))
+
+        # 태그가 없는 조합은 요청하지 않음
+        return [
+            cls._alarm_payload(list(tag_ids), *key)
+            for key, tag_ids in merged.items()
+            if tag_ids
+        ]
+
+
+class LocalSenseAPI(_LocalSenseBase):
+    _POOL_MAXSIZE = 50
+    # send_many 동시 요청 수 (연결 풀 크기를 넘지 않도록 제한)
+    _MAX_WORKERS = min(8, _POOL_MAXSIZE)
+
+    def __init__(self, base_url: str, secret_key: str, algo: str = "md5"):
+        super().__init__(base_url, secret_key, algo)
+
+        # 같은 LocalSense 서버로 반복 요청하므로 keep-alive 연결 재사용
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=self._POOL_MAXSIZE, max_retries=0)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        # send_many용 스레드 풀 (스레드는 첫 요청 시 생성됨)
+        self._executor = ThreadPoolExecutor(max_workers=self._MAX_WORKERS, thread_name_prefix="localsense")
+
+    def close(self) -> None:
+        """스레드 풀과 HTTP 세션 종료 (풀링된 연결 해제)"""
+        self._executor.shutdown(wait=True)
+        self._session.close()
+
+    def __enter__(self) -> "LocalSenseAPI":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _post(self, path: str, payload: Dict[str, Any], timeout: float = 10.0) -> Dict[str, Any]:
+        """공통 POST 처리"""
+        # orjson은 공백 없는 UTF-8 bytes를 바로 생성
+        return self._post_body(path, orjson.dumps(payload), timeout=timeout)
+
+    def _post_body(self, path: str, body: bytes, timeout: float = 10.0) -> Dict[str, Any]:
+        """직렬화된 body POST 처리"""
+        url = self._urls.get(path) or self._urls.setdefault(path, self.base_url + path)
+        headers = self._headers(path, body)
+
+        try:
+            with self._session.post(url, data=body, headers=headers, timeout=timeout, stream=False) as resp:
+                return self._parse_response(resp.status_code, resp.headers, resp.content)
         except requests.exceptions.RequestException as e:
             return {"issuccess": "false", "message": f"네트워크 오류: {e}"}
 
@@ -59,17 +237,11 @@ class LocalSenseAPI:
         timeout: float = 10.0,
     ) -> Dict[str, Any]:
         """부저만 전송"""
-        path = "/andon/alarm"
-        payload = {
-            "tag_ids": tag_ids,
-            "shake_sdur": shake_sdur,
-            "shake_edur": shake_edur,
-            "vibrate_times": 0,
-            "vibrate_dur": 15,
-            "send_counts": send_counts,
-            "send_interval": send_interval,
-        }
-        return self._post(path, payload, timeout=timeout)
+        # 대상 태그가 없으면 요청 생략
+        if not tag_ids:
+            return {"issuccess": "true", "message": "no tags"}
+        payload = self._alarm_payload(tag_ids, shake_sdur, shake_edur, 0, 15, send_counts, send_interval)
+        return self._post("/andon/alarm", payload, timeout=timeout)
 
     def send_vibration(
         self,
@@ -82,17 +254,11 @@ class LocalSenseAPI:
         timeout: float = 10.0,
     ) -> Dict[str, Any]:
         """진동만 전송"""
-        path = "/andon/alarm"
-        payload = {
-            "tag_ids": tag_ids,
-            "shake_sdur": 0,
-            "shake_edur": 15,
-            "vibrate_times": vibrate_times,
-            "vibrate_dur": vibrate_dur,
-            "send_counts": send_counts,
-            "send_interval": send_interval,
-        }
-        return self._post(path, payload, timeout=timeout)
+        # 대상 태그가 없으면 요청 생략
+        if not tag_ids:
+            return {"issuccess": "true", "message": "no tags"}
+        payload = self._alarm_payload(tag_ids, 0, 15, vibrate_times, vibrate_dur, send_counts, send_interval)
+        return self._post("/andon/alarm", payload, timeout=timeout)
 
     def send_display_message(
         self,
@@ -105,18 +271,11 @@ class LocalSenseAPI:
         timeout: float = 10.0,
     ) -> Dict[str, Any]:
         """태그 디스플레이에 메시지 전송"""
-        path = "/andon/show"
-        payload = {
-            "iwatchid": str(tag_id),
-            "msgid": "10",
-            "msgtitle": title,
-            "msgdesc": message,
-            "msgtime": "123",
-            "msgtype": msg_type,
-            "vibrateoff": "1" if vibrate_off else "0",
-        }
-        return self._post(path, payload, timeout=timeout)
-    
+        if tag_id is None:
+            return {"issuccess": "false", "message": "tag_id가 필요합니다"}
+        body = self._display_body_cached(tag_id, title, message, msg_type, vibrate_off)
+        return self._post_body("/andon/show", body, timeout=timeout)
+
     def send_vibration_and_buzzer(
         self,
         tag_ids: List[int],
@@ -130,14 +289,180 @@ class LocalSenseAPI:
         timeout: float = 10.0,
     ) -> Dict[str, Any]:
         """진동 + 부저 함께 전송"""
-        path = "/andon/alarm"
-        payload = {
-            "tag_ids": tag_ids,
-            "shake_sdur": shake_sdur,
-            "shake_edur": shake_edur,
-            "vibrate_times": vibrate_times,
-            "vibrate_dur": vibrate_dur,
-            "send_counts": send_counts,
-            "send_interval": send_interval,
-        }
-        return self._post(path, payload, timeout=timeout)
+        # 대상 태그가 없으면 요청 생략
+        if not tag_ids:
+            return {"issuccess": "true", "message": "no tags"}
+        payload = self._alarm_payload(
+            tag_ids, shake_sdur, shake_edur, vibrate_times, vibrate_dur, send_counts, send_interval
+        )
+        return self._post("/andon/alarm", payload, timeout=timeout)
+
+    def send_alarm_batch(
+        self,
+        groups: List[Tuple[List[int], Dict[str, Any]]],
+        *,
+        timeout: float = 10.0,
+    ) -> List[Dict[str, Any]]:
+        """
+        알람 일괄 전송 (/andon/alarm)
+        같은 알람 파라미터(shake_*, vibrate_*, send_*)를 가진 그룹의 태그를 합쳐 파라미터 조합당 1회만 요청
+
+        Args:
+            groups: [(tag_ids, alarm_params), ...] 형태의 목록
+        """
+        return [
+            self._post("/andon/alarm", payload, timeout=timeout)
+            for payload in self._alarm_batch_payloads(groups)
+        ]
+
+    def send_many(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]],
+        *,
+        timeout: float = 10.0,
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 요청을 스레드 풀에서 동시에 전송 (I/O 대기 중에는 GIL이 해제됨)
+
+        Args:
+            calls: [(path, payload), ...] 형태의 요청 목록
+
+        Returns:
+            calls와 같은 순서의 응답 목록
+        """
+        results: List[Dict[str, Any]] = [{} for _ in calls]
+        futures = {}
+        for index, (path, payload) in enumerate(calls):
+            # 대상 태그가 없으면 요청 생략 (send_* 메서드와 동일)
+            if "tag_ids" in payload and not payload["tag_ids"]:
+                results[index] = {"issuccess": "true", "message": "no tags"}
+                continue
+            futures[self._executor.submit(self._post, path, payload, timeout)] = index
+
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+        return results
+
+
+class AsyncLocalSenseAPI(_LocalSenseBase):
+    """
+    LocalSenseAPI의 비동기 버전 (httpx.AsyncClient 기반)
+    여러 태그에 대한 알람/메시지를 asyncio.gather로 동시에 전송할 때 사용
+    """
+
+    def __init__(self, base_url: str, secret_key: str, algo: str = "md5"):
+        super().__init__(base_url, secret_key, algo)
+
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=10),
+            timeout=10.0,
+        )
+
+    async def aclose(self) -> None:
+        """HTTP 클라이언트 종료 (풀링된 연결 해제)"""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncLocalSenseAPI":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def _post(self, path: str, payload: Dict[str, Any], timeout: float = 10.0) -> Dict[str, Any]:
+        """공통 POST 처리"""
+        # orjson은 공백 없는 UTF-8 bytes를 바로 생성
+        return await self._post_body(path, orjson.dumps(payload), timeout=timeout)
+
+    async def _post_body(self, path: str, body: bytes, timeout: float = 10.0) -> Dict[str, Any]:
+        """직렬화된 body POST 처리"""
+        headers = self._headers(path, body)
+
+        try:
+            resp = await self._client.post(path, content=body, headers=headers, timeout=timeout)
+            return self._parse_response(resp.status_code, resp.headers, resp.content)
+        except httpx.HTTPError as e:
+            return {"issuccess": "false", "message": f"네트워크 오류: {e}"}
+
+    async def send_buzzer(
+        self,
+        tag_ids: List[int],
+        *,
+        shake_sdur: int = 5,
+        shake_edur: int = 15,
+        send_counts: int = 1,
+        send_interval: int = 1,
+        timeout: float = 10.0,
+    ) -> Dict[str, Any]:
+        """부저만 전송"""
+        # 대상 태그가 없으면 요청 생략
+        if not tag_ids:
+            return {"issuccess": "true", "message": "no tags"}
+        payload = self._alarm_payload(tag_ids, shake_sdur, shake_edur, 0, 15, send_counts, send_interval)
+        return await self._post("/andon/alarm", payload, timeout=timeout)
+
+    async def send_vibration(
+        self,
+        tag_ids: List[int],
+        *,
+        vibrate_times: int = 1,
+        vibrate_dur: int = 6,
+        send_counts: int = 1,
+        send_interval: int = 1,
+        timeout: float = 10.0,
+    ) -> Dict[str, Any]:
+        """진동만 전송"""
+        # 대상 태그가 없으면 요청 생략
+        if not tag_ids:
+            return {"issuccess": "true", "message": "no tags"}
+        payload = self._alarm_payload(tag_ids, 0, 15, vibrate_times, vibrate_dur, send_counts, send_interval)
+        return await self._post("/andon/alarm", payload, timeout=timeout)
+
+    async def send_display_message(
+        self,
+        tag_id: int,
+        *,
+        title: str = "경고",
+        message: str = "위험구역 진입!",
+        msg_type: str = "0",
+        vibrate_off: bool = False,  # 진동도 같이 켜기
+        timeout: float = 10.0,
+    ) -> Dict[str, Any]:
+        """태그 디스플레이에 메시지 전송"""
+        if tag_id is None:
+            return {"issuccess": "false", "message": "tag_id가 필요합니다"}
+        body = self._display_body_cached(tag_id, title, message, msg_type, vibrate_off)
+        return await self._post_body("/andon/show", body, timeout=timeout)
+
+    async def send_vibration_and_buzzer(
+        self,
+        tag_ids: List[int],
+        *,
+        shake_sdur: int = 5,
+        shake_edur: int = 15,
+        vibrate_times: int = 1,
+        vibrate_dur: int = 6,
+        send_counts: int = 1,
+        send_interval: int = 1,
+        timeout: float = 10.0,
+    ) -> Dict[str, Any]:
+        """진동 + 부저 함께 전송"""
+        # 대상 태그가 없으면 요청 생략
+        if not tag_ids:
+            return {"issuccess": "true", "message": "no tags"}
+        payload = self._alarm_payload(
+            tag_ids, shake_sdur, shake_edur, vibrate_times, vibrate_dur, send_counts, send_interval
+        )
+        return await self._post("/andon/alarm", payload, timeout=timeout)
+
+    async def send_alarm_batch(
+        self,
+        groups: List[Tuple[List[int], Dict[str, Any]]],
+        *,
+        timeout: float = 10.0,
+    ) -> List[Dict[str, Any]]:
+        """알람 일괄 전송 (파라미터 조합별 요청을 동시에 전송)"""
+        return list(await asyncio.gather(*(
+            self._post("/andon/alarm", payload, timeout=timeout)
+            for payload in self._alarm_batch_payloads(groups)
+        )))